@@ -1,12 +1,41 @@
 # app.py
 from flask import Flask, render_template, request, jsonify
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
+import codecs
+import io
 import json
+import sys
 import time
-from datetime import datetime
+import threading
+import functools
+import operator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; armoured detection falls back to substring scans
+    ahocorasick = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it the API payload is parsed in one go
+    ijson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,17 +50,202 @@ USERNAME = os.getenv("AUTOTRADER_USERNAME")
 PASSWORD = os.getenv("AUTOTRADER_PASSWORD")
 API_URL = os.getenv("API_URL")
 
+# Shared HTTP session so API calls reuse pooled connections instead of a new TLS handshake each time
+_AUTH = HTTPBasicAuth(USERNAME, PASSWORD)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        read=0,  # a silent upstream costs one read timeout per fetch, not four
+        connect=1,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # hand the last error response back so its body gets logged
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
 # Cache settings
 CACHE_FILE = "cache_listings.json"
 CACHE_TIMEOUT = 1800  # 30 minutes (in seconds)
+REFRESH_INTERVAL = CACHE_TIMEOUT * 0.9  # background refresh, shortly before the data expires
+REFRESH_RETRY_DELAY = 60  # seconds between background attempts while the API is failing
+COLD_CACHE_WAIT = 5  # seconds a request waits for the refresher's first load before serving nothing
+
+# Feeds with more listings than this are processed across a process pool on
+# multi-core hosts. Processing costs ~20µs per listing while a spawned pool
+# costs ~0.3s to start plus ~10µs per listing to pickle results back, so the
+# pool only wins on very large feeds.
+PARALLEL_THRESHOLD = 50_000
+
+# In-memory cache of processed listings, shared by all requests in this process.
+# The on-disk cache only serves as a warm start across restarts.
+_MEM_CACHE = {"ts": 0, "listings": None, "by_id": {}, "views": {}}
+_MEM_LOCK = threading.Lock()
+
+
+# Current time at one-second granularity: (unix second, naive UTC datetime, local ISO string)
+_CLOCK = (0, None, "")
+
+
+def _clock():
+    global _CLOCK
+    now = int(time.time())
+    if now != _CLOCK[0]:
+        # Swap in a new tuple so concurrent readers never see a half-updated value
+        _CLOCK = (
+            now,
+            datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None),
+            datetime.fromtimestamp(now).isoformat(),
+        )
+    return _CLOCK
+
+
+def _utcnow():
+    return _clock()[1]
+
+
+_NOW_CONTEXT = {'now': _utcnow}
 
 
 # Inject current time for footer copyright
 @app.context_processor
 def inject_now():
-    return {'now': datetime.utcnow}
+    return _NOW_CONTEXT
+
+
+def json_loads(data):
+    """Parse JSON from UTF-8 bytes, using orjson when available"""
+    if orjson is not None:
+        if data[:3] == codecs.BOM_UTF8:
+            data = data[3:]  # orjson rejects a BOM; json.loads and requests accept it
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which orjson rejects but json handles
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
+class _DigitsTable(dict):
+    """str.translate table that keeps digits and drops every other character.
+
+    Equivalent to ''.join(filter(str.isdigit, s)) but runs in C; entries are
+    filled in on first sight of each code point.
+    """
+
+    def __missing__(self, codepoint):
+        value = codepoint if chr(codepoint).isdigit() else None
+        self[codepoint] = value
+        return value
+
+
+_DIGITS_TABLE = _DigitsTable()
+
+
+# "protection" also covers "executive protection"
+_ARMOURED_KEYWORDS = (
+    'armoured', 'armored', 'bulletproof', 'b6', 'b7', 'vr7', 'vr9',
+    'runflat', 'reinforced', 'protection'
+)
+
+if ahocorasick is not None:
+    _ARMOURED_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ARMOURED_KEYWORDS:
+        _ARMOURED_AUTOMATON.add_word(_keyword, _keyword)
+    _ARMOURED_AUTOMATON.make_automaton()
+else:
+    _ARMOURED_AUTOMATON = None
+
+
+def _has_armoured_keyword(text):
+    text = text.lower()
+    if _ARMOURED_AUTOMATON is not None:
+        # Single linear pass matching all keywords at once; stops at the first hit
+        return next(_ARMOURED_AUTOMATON.iter(text), None) is not None
+    return any(keyword in text for keyword in _ARMOURED_KEYWORDS)
+
+
+def _space_thousands(value):
+    """Format a number with space thousand separators, e.g. 1200000 -> '1 200 000'"""
+    if isinstance(value, float):
+        return f"{value:,.0f}".replace(',', ' ')
+    return f"{value:,}".replace(',', ' ')
+
+
+@functools.lru_cache(maxsize=2048)
+def _title(name):
+    """Title-case a make or model name; feeds repeat the same few names, so memoize and intern"""
+    return sys.intern(name.title())
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso_datetime(dt_str):
+    """Convert an ISO 8601 string to a POSIX timestamp, or 0 if it can't be parsed.
+
+    Memoized because many listings share the same created timestamps.
+    """
+    try:
+        if not dt_str:
+            return 0
+        # Fast path for the common "YYYY-MM-DDTHH:MM:SSZ" form
+        if (len(dt_str) == 20 and dt_str[19] == 'Z' and dt_str[4] == '-' and dt_str[7] == '-'
+                and dt_str[13] == ':' and dt_str[16] == ':'):
+            return datetime(
+                int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+                int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]),
+                tzinfo=timezone.utc,
+            ).timestamp()
+        if dt_str.endswith('Z'):
+            dt_str = dt_str[:-1] + '+00:00'
+        if '+' in dt_str and len(dt_str.split('+')[-1]) == 4:
+            parts = dt_str.split('+')
+            dt_str = f"{parts[0]}+{parts[1][:2]}:{parts[1][2:]}"
+        dt = datetime.fromisoformat(dt_str)
+        return dt.timestamp()
+    except Exception as e:
+        logger.warning(f"Failed to parse datetime: {dt_str} | Error: {e}")
+        return 0
+
+
+@dataclass(slots=True)
+class Listing:
+    """A processed vehicle listing, as rendered by the templates"""
+    id: Any
+    make: str
+    model: str
+    year: Any
+    price_display: str
+    price: float
+    image_urls: list
+    variant: str
+    body_type: str
+    colour: str
+    location: str
+    mileage: str
+    description: str
+    created: str
+    created_timestamp: float
+    engine: str
+    is_armoured: bool
+
+
+# Don't JIT these with Numba (@jit/@njit). Listing processing is string parsing,
+# datetime parsing and dict access, which Numba either rejects or runs in object
+# mode, slower than plain CPython. See the supported-features reference:
+# https://numba.readthedocs.io/en/stable/reference/pysupported.html
+# If numeric-heavy code shows up later (e.g. recommendations), put it in its own
+# module and use @njit(cache=True) on NumPy arrays there, not on Python strings.
 class VehicleListingProcessor:
     """Handles processing and formatting of vehicle listings"""
 
@@ -39,33 +253,19 @@ class VehicleListingProcessor:
     def is_armoured(description, make="", model=""):
         """Detect if a vehicle is armoured based on description or known models"""
         if not description:
+            if not (make or model):
+                return False
             description = ""
-        description_lower = description.lower()
-        make_model = f"{make} {model}".lower()
-        armoured_keywords = [
-            'armoured', 'armored', 'bulletproof', 'b6', 'b7', 'vr7', 'vr9',
-            'runflat', 'reinforced', 'protection', 'executive protection'
-        ]
-        for keyword in armoured_keywords:
-            if keyword in description_lower or keyword in make_model:
-                return True
-        return False
+        # One scan over everything; keywords contain no spaces, so nothing can match across the joins
+        return _has_armoured_keyword(f"{description} {make} {model}")
 
     @staticmethod
     def parse_iso_datetime(dt_str):
-        try:
-            if not dt_str:
-                return 0
-            if dt_str.endswith('Z'):
-                dt_str = dt_str[:-1] + '+00:00'
-            if '+' in dt_str and len(dt_str.split('+')[-1]) == 4:
-                parts = dt_str.split('+')
-                dt_str = f"{parts[0]}+{parts[1][:2]}:{parts[1][2:]}"
-            dt = datetime.fromisoformat(dt_str)
-            return dt.timestamp()
-        except Exception as e:
-            logger.warning(f"Failed to parse datetime: {dt_str} | Error: {e}")
+        if not isinstance(dt_str, str):
+            if dt_str:
+                logger.warning(f"Failed to parse datetime: {dt_str!r} | Error: not a string")
             return 0
+        return _parse_iso_datetime(dt_str)
 
     @staticmethod
     def format_price(raw_price_str):
@@ -83,22 +283,20 @@ class VehicleListingProcessor:
                 if len(parts) == 2:
                     major_part_str = parts[0]
                     minor_part_str = parts[1][:2]
-                    major_digits_only = ''.join(filter(str.isdigit, major_part_str))
+                    major_digits_only = major_part_str.translate(_DIGITS_TABLE)
                     if not major_digits_only:
                         major_digits_only = "0"
                     price_float_str = f"{major_digits_only}.{minor_part_str}"
                     price_value_for_sorting = float(price_float_str)
-                    major_int = int(major_digits_only)
-                    formatted_major = f"{major_int:,}".replace(',', ' ')
-                    price_display = f"R{formatted_major}"
+                    price_display = f"R{_space_thousands(int(major_digits_only))}"
                 else:
-                    clean_str = ''.join(filter(str.isdigit, raw_price_str))
+                    clean_str = raw_price_str.translate(_DIGITS_TABLE)
                     if clean_str:
                         price_value_for_sorting = float(clean_str)
-                        price_display = f"R{price_value_for_sorting:,.0f}".replace(',', ' ')
+                        price_display = f"R{_space_thousands(price_value_for_sorting)}"
             elif isinstance(raw_price_str, (int, float)):
                 price_value_for_sorting = float(raw_price_str)
-                price_display = f"R{price_value_for_sorting:,.0f}".replace(',', ' ')
+                price_display = f"R{_space_thousands(price_value_for_sorting)}"
         except (ValueError, IndexError, TypeError) as e:
             logger.warning(f"Error parsing price '{raw_price_str}': {e}")
         return price_display, price_value_for_sorting
@@ -107,14 +305,14 @@ class VehicleListingProcessor:
     def format_mileage(mileage):
         try:
             mileage_int = int(mileage) if mileage else 0
-            return f"{mileage_int:,}".replace(',', ' ')
+            return _space_thousands(mileage_int)
         except (ValueError, TypeError):
             return "0"
 
     @staticmethod
     def process_listing(item):
-        make = item.get("make", "Unknown").title()
-        model = item.get("model", "Model").title()
+        make = _title(item.get("make", "Unknown"))
+        model = _title(item.get("model", "Model"))
         year = item.get("year", "N/A")
         location = item.get("location", "South Africa")
         colour = item.get("colour", "Unknown")
@@ -134,37 +332,37 @@ class VehicleListingProcessor:
         # Detect armoured status
         is_armoured = VehicleListingProcessor.is_armoured(description, make, model)
 
-        return {
-            "id": item.get("id"),
-            "make": make,
-            "model": model,
-            "year": year,
-            "price_display": price_display,
-            "price": price_value_for_sorting,
-            "image_urls": image_urls,
-            "variant": variant,
-            "body_type": body_type,
-            "colour": colour,
-            "location": location,
-            "mileage": formatted_mileage,
-            "description": description,
-            "created": created,
-            "created_timestamp": created_timestamp,
-            "engine": engine,
-            "is_armoured": is_armoured  # ✅ Added
-        }
+        return Listing(
+            id=item.get("id"),
+            make=make,
+            model=model,
+            year=year,
+            price_display=price_display,
+            price=price_value_for_sorting,
+            image_urls=image_urls,
+            variant=variant,
+            body_type=body_type,
+            colour=colour,
+            location=location,
+            mileage=formatted_mileage,
+            description=description,
+            created=created,
+            created_timestamp=created_timestamp,
+            engine=engine,
+            is_armoured=is_armoured,
+        )
 
 
 class CacheManager:
     @staticmethod
-    def get_listings_from_cache():
+    def get_listings_from_cache(max_age=CACHE_TIMEOUT):
         if os.path.exists(CACHE_FILE):
             try:
-                with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                    cache = json.load(f)
-                if time.time() - cache["timestamp"] < CACHE_TIMEOUT:
+                with open(CACHE_FILE, "rb") as f:
+                    cache = json_loads(f.read())
+                if time.time() - cache["timestamp"] < max_age:
                     logger.info("✅ Using cached API data")
-                    return cache["data"]
+                    return cache["data"], cache["timestamp"]
                 else:
                     logger.info("⏳ Cache expired, will fetch fresh data")
             except (json.JSONDecodeError, KeyError) as e:
@@ -173,39 +371,115 @@ class CacheManager:
 
     @staticmethod
     def save_listings_to_cache(data):
+        # Write to a per-process temp file and rename it into place, so readers
+        # in other workers never see a half-written cache file
+        tmp_file = f"{CACHE_FILE}.tmp.{os.getpid()}"
         try:
             cache = {
                 "timestamp": time.time(),
                 "data": data
             }
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, "wb") as f:
+                f.write(json_dumps(cache))
+            os.replace(tmp_file, CACHE_FILE)
             logger.info("💾 Fresh data saved to cache")
         except Exception as e:
             logger.error(f"❌ Failed to save cache: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
 
 
 class APIClient:
     """Handles API communication"""
     
+    @staticmethod
+    def stream_listings(response):
+        """Stream-parse the listings out of a response opened with stream=True.
+
+        Only the listing items are built as Python objects; other top-level keys
+        are skipped as they stream past, and the raw payload is never held in
+        memory as a whole.
+        """
+        response.raw.decode_content = True  # let urllib3 undo gzip/deflate
+        response.raw.auto_close = False  # BufferedReader must see EOF, not a closed file
+        stream = io.BufferedReader(response.raw)
+        first = APIClient.skip_preamble(stream)
+        if first == b"[":
+            found = APIClient.collect_items(ijson.parse(stream), ("item",))
+            return found["item"]
+        if first == b"{":
+            found = APIClient.collect_items(ijson.parse(stream), ("listings.item", "vehicles.item"))
+            return found["listings.item"] or found["vehicles.item"]
+        logger.error(f"Unexpected start of API response: {first!r}")
+        return None
+
+    @staticmethod
+    def skip_preamble(stream):
+        """Consume a UTF-8 BOM and leading whitespace; return the first JSON byte (b"" at EOF)"""
+        if stream.peek(3)[:3] == codecs.BOM_UTF8:
+            stream.read(3)
+        while True:
+            chunk = stream.peek(1)
+            if not chunk:
+                return b""
+            skip = len(chunk) - len(chunk.lstrip())
+            if not skip:
+                return chunk[:1]
+            stream.read(skip)
+
+    @staticmethod
+    def collect_items(events, item_prefixes):
+        """Build the array items under each of item_prefixes from ijson parse events.
+
+        Works like ijson.items() for several prefixes in one pass; events under
+        any other prefix are ignored without building anything. Numbers come out
+        as int or float, as with json.loads.
+        """
+        found = {item_prefix: [] for item_prefix in item_prefixes}
+        builder = None
+        for prefix, event, value in events:
+            if event == "number" and type(value) is Decimal:
+                # ijson yields Decimal for non-integers; json.loads would give float
+                value = float(value)
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event == end_event:
+                    found[item_prefix].append(builder.value)
+                    builder = None
+            elif prefix in found:
+                if event in ("start_map", "start_array"):
+                    item_prefix = prefix
+                    end_event = "end_map" if event == "start_map" else "end_array"
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    found[prefix].append(value)
+        return found
+
     @staticmethod  # ✅ Properly indented inside class
     def fetch_listings_from_api():
         logger.info("📡 Fetching fresh data from API...")
         try:
-            response = requests.get(
+            with _SESSION.get(
                 API_URL,
-                auth=(USERNAME, PASSWORD),
+                auth=_AUTH,
                 timeout=10,
-                headers={"Accept": "application/json"}
-            )
+                headers={"Accept": "application/json", "Accept-Encoding": "gzip, deflate"},
+                stream=ijson is not None,
+            ) as response:
+                logger.info(f"API Response Status: {response.status_code}")
+
+                if response.status_code != 200:
+                    logger.error(f"API Error Body: {response.text[:300]}")
+                    return None
 
-            logger.info(f"API Response Status: {response.status_code}")
-            
-            if response.status_code != 200:
-                logger.error(f"API Error Body: {response.text[:300]}")
-                return None
+                if ijson is not None:
+                    return APIClient.stream_listings(response)
+                # Parse the (already gunzipped) bytes directly rather than via response.text
+                raw_data = json_loads(response.content)
 
-            raw_data = response.json()
             if isinstance(raw_data, list):
                 return raw_data
             elif isinstance(raw_data, dict):
@@ -220,30 +494,156 @@ class APIClient:
             logger.error(f"Invalid JSON from API: {e}")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            if ijson is not None and isinstance(e, ijson.JSONError):
+                logger.error(f"Invalid JSON from API: {e}")
+            else:
+                logger.error(f"Unexpected error: {e}")
             return None
 
 
-def fetch_listings():
-    cached_data = CacheManager.get_listings_from_cache()
-    
-    if cached_data is not None:
-        raw_listings = cached_data
+def process_listings(raw_listings):
+    """Process raw API items, fanning out to a process pool for very large feeds"""
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(raw_listings) > PARALLEL_THRESHOLD:
+        # spawn rather than fork: forking a process that runs other threads can deadlock
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(VehicleListingProcessor.process_listing, raw_listings, chunksize=256))
+    return [VehicleListingProcessor.process_listing(item) for item in raw_listings]
+
+
+def load_listings(max_age=CACHE_TIMEOUT):
+    """Load raw listings from the disk cache or the API and process them.
+
+    The disk cache is used if it is younger than ``max_age`` seconds. Returns the
+    processed listings and the time the underlying data was fetched, or ``None``
+    as the timestamp when nothing could be loaded.
+    """
+    cached = CacheManager.get_listings_from_cache(max_age)
+    fetched_at = None
+
+    if cached is not None:
+        raw_listings, fetched_at = cached
     else:
         raw_listings = APIClient.fetch_listings_from_api()
         if raw_listings is not None:
             CacheManager.save_listings_to_cache(raw_listings)
-        elif cached_data is not None:
-            logger.warning("⚠️ Using stale cache due to API failure")
-            raw_listings = cached_data
+            fetched_at = time.time()
         else:
             logger.error("❌ No cache available. Showing empty list.")
             raw_listings = []
 
-    listings = [VehicleListingProcessor.process_listing(item) for item in raw_listings]
-    listings.sort(key=lambda x: x["created_timestamp"], reverse=True)
+    listings = process_listings(raw_listings)
+    listings.sort(key=operator.attrgetter("created_timestamp"), reverse=True)
     logger.info(f"📦 Total processed & sorted listings: {len(listings)}")
-    return listings
+    return listings, fetched_at
+
+
+def listing_key(listing_id):
+    """Normalize a listing id so API ids match URL ids the way templates render them"""
+    return str(listing_id).strip()
+
+
+def build_listing_views(listings):
+    """Precompute every inventory view, keyed by (armoured filter, sort order)"""
+    by_price = operator.attrgetter("price")
+    orderings = {
+        "newest": listings,
+        "price_high": sorted(listings, key=by_price, reverse=True),
+        "price_low": sorted(listings, key=by_price),
+    }
+    views = {}
+    for sort, ordered in orderings.items():
+        views[("all", sort)] = ordered
+        views[("yes", sort)] = [car for car in ordered if car.is_armoured]
+        views[("no", sort)] = [car for car in ordered if not car.is_armoured]
+    return views
+
+
+def _mem_cache_fresh(max_age=CACHE_TIMEOUT):
+    return _MEM_CACHE["listings"] is not None and time.time() - _MEM_CACHE["ts"] < max_age
+
+
+def refresh_listings(max_age=CACHE_TIMEOUT):
+    """Reload the in-memory cache unless it is younger than max_age; return the listings to serve"""
+    with _MEM_LOCK:
+        # Another thread may have refreshed the cache while we waited
+        if _mem_cache_fresh(max_age):
+            return _MEM_CACHE["listings"]
+
+        listings, fetched_at = load_listings(max_age)
+        if fetched_at is None:
+            # Nothing loaded; keep serving what we have and retry later
+            if _MEM_CACHE["listings"] is not None:
+                logger.warning("⚠️ Using stale in-memory listings due to API failure")
+                return _MEM_CACHE["listings"]
+            return listings
+
+        # On duplicate ids keep the first (newest) listing, like a linear scan would
+        by_id = {}
+        for listing in listings:
+            if listing.id is not None:
+                by_id.setdefault(listing_key(listing.id), listing)
+
+        # Swap everything in one update so readers never mix old and new data
+        _MEM_CACHE.update({
+            "by_id": by_id,
+            "views": build_listing_views(listings),
+            "listings": listings,
+            "ts": fetched_at,
+        })
+        return listings
+
+
+def _refresher_running():
+    return _REFRESHER is not None and _REFRESHER.is_alive()
+
+
+def fetch_listings():
+    """Return processed listings, newest first. Callers must not mutate the result."""
+    listings = _MEM_CACHE["listings"]
+    # While the background refresher is running it keeps the cache warm, so even
+    # slightly stale listings are served rather than blocking on the API
+    if listings is not None and (_mem_cache_fresh() or _refresher_running()):
+        return listings
+    if _refresher_running():
+        # Cold cache: the refresher owns fetching. Give its first load a moment to
+        # finish, but never queue a second API call behind one that is hanging
+        # or has just failed; it retries every REFRESH_RETRY_DELAY seconds
+        _FIRST_REFRESH_DONE.wait(COLD_CACHE_WAIT)
+        return _MEM_CACHE["listings"] or []
+    return refresh_listings()
+
+
+def _refresh_forever():
+    # The first pass may warm-start from a disk cache of any valid age; later
+    # passes only accept a disk cache another worker wrote since our last refresh
+    max_age = CACHE_TIMEOUT
+    while True:
+        try:
+            refresh_listings(max_age)
+        except Exception:
+            logger.exception("❌ Background cache refresh failed")
+        _FIRST_REFRESH_DONE.set()
+        max_age = CACHE_TIMEOUT - REFRESH_INTERVAL
+        time.sleep(max(_MEM_CACHE["ts"] + REFRESH_INTERVAL - time.time(), REFRESH_RETRY_DELAY))
+
+
+_REFRESHER = None
+_FIRST_REFRESH_DONE = threading.Event()
+
+
+def start_cache_refresher():
+    """Start the background thread that keeps the in-memory cache warm"""
+    global _REFRESHER
+    if not _refresher_running():
+        _REFRESHER = threading.Thread(target=_refresh_forever, name="cache-refresher", daemon=True)
+        _REFRESHER.start()
+
+
+# Pool workers spawned by process_listings() import this module too; only the
+# serving process refreshes the cache
+if multiprocessing.parent_process() is None:
+    start_cache_refresher()
 
 
 # ——— ROUTES ———
@@ -251,9 +651,8 @@ def fetch_listings():
 @app.route("/")
 def home():
     try:
-        listings = fetch_listings()
-        sorted_by_price = sorted(listings, key=lambda x: x.get("price", 0), reverse=True)
-        featured_listings = sorted_by_price[:3] if sorted_by_price else []
+        fetch_listings()
+        featured_listings = _MEM_CACHE["views"].get(("all", "price_high"), [])[:3]
         return render_template("home.html", featured_listings=featured_listings)
     except Exception as e:
         logger.error(f"Error in home route: {e}")
@@ -278,19 +677,14 @@ def contact():
 @app.route("/inventory")
 def inventory():
     try:
-        listings = fetch_listings()
+        fetch_listings()
         sort = request.args.get('sort', 'newest')
         armoured = request.args.get('armoured', 'all')
 
-        if armoured == 'yes':
-            listings = [car for car in listings if car.get('is_armoured')]
-        elif armoured == 'no':
-            listings = [car for car in listings if not car.get('is_armoured')]
-
-        if sort == 'price_high':
-            listings.sort(key=lambda x: x.get('price', 0), reverse=True)
-        elif sort == 'price_low':
-            listings.sort(key=lambda x: x.get('price', 0))
+        # Filtered and sorted views are precomputed on each cache refresh
+        view_sort = sort if sort in ('price_high', 'price_low') else 'newest'
+        view_armoured = armoured if armoured in ('yes', 'no') else 'all'
+        listings = _MEM_CACHE["views"].get((view_armoured, view_sort), [])
 
         return render_template("index.html", listings=listings, sort=sort, armoured=armoured)
     except Exception as e:
@@ -301,12 +695,12 @@ def inventory():
 @app.route("/listing/<listing_id>")
 def listing_detail(listing_id):
     try:
-        listings = fetch_listings()
-        for listing in listings:
-            if str(listing.get("id")) == str(listing_id):
-                return render_template("listing.html", car=listing)
-        # If not found, return 404 (no secondary API call needed)
-        return "Vehicle not found", 404
+        fetch_listings()
+        car = _MEM_CACHE["by_id"].get(listing_key(listing_id))
+        if car is None:
+            # If not found, return 404 (no secondary API call needed)
+            return "Vehicle not found", 404
+        return render_template("listing.html", car=car)
     except Exception as e:
         logger.error(f"Error fetching listing {listing_id}: {e}")
         return "Vehicle not found", 404
@@ -341,7 +735,7 @@ def privacy_policy():
 
 @app.route("/health")
 def health_check():
-    return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
+    return jsonify({"status": "healthy", "timestamp": _clock()[2]})
 
 
 if __name__ == "__main__":